@@ -9,19 +9,28 @@ This script is intended to be run as a standalone tool.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
+import argparse
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import asdict, dataclass
 from typing import Dict, Optional
 import gspread
 from google.oauth2.service_account import Credentials
-from parser.request import get_page
+from parser.cache import load_items, open_cache, save_items
+from parser.request import fetch_all, get_page
 from parser.parser import Parser
 
 
 SPREADSHEET_NAME = "ebay-parser-portfolio"
 CREDENTIALS_PATH = "creds/sheets_creds.json"
+CACHE_PATH = "cache/items.sqlite3"
+CACHE_TTL = 6 * 60 * 60  # seconds
+UPDATE_CHUNK_SIZE = 500  # ranges per batch_update request
+UPDATE_WORKERS = 4  # batch_update requests sent concurrently
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Item:
     """Container for parsed item data."""
     link: str
@@ -35,6 +44,20 @@ class Item:
     model: Optional[str] = None
 
 
+@dataclass
+class SheetSnapshot:
+    """Sheet contents read once and shared by link lookup and the update."""
+    links: list[str]  # link column, one entry per data row starting at row 2
+    col_index: Dict[str, int]
+
+    def col(self, name: str) -> int:
+        """Return 1-based index of the column with the given header."""
+        try:
+            return self.col_index[name]
+        except KeyError:
+            raise RuntimeError(f"Column '{name}' not found in the sheet")
+
+
 def get_sheet():
     """Authorize and return the first worksheet of the target spreadsheet."""
     creds = Credentials.from_service_account_file(
@@ -48,25 +71,29 @@ def get_sheet():
     return client.open(SPREADSHEET_NAME).sheet1
 
 
-def get_links(sheet) -> list[str]:
-    """Read all links from the 'link' column of the sheet."""
-    values = sheet.get_all_values()
-    if not values:
-        return []
+def read_snapshot(sheet) -> SheetSnapshot:
+    """Read the header row and the 'link' column; other cells are never needed."""
+    headers = sheet.row_values(1)
+    if not headers:
+        return SheetSnapshot(links=[], col_index={})
 
-    try:
-        link_col_index = values[0].index("link")
-    except ValueError:
+    col_index: Dict[str, int] = {}
+    for idx, name in enumerate(headers, start=1):
+        col_index.setdefault(name, idx)
+
+    if "link" not in col_index:
         raise RuntimeError("Column 'link' not found in the first row of the sheet")
 
-    links: list[str] = []
+    letter = column_to_letter(col_index["link"])
+    column = sheet.get(f"{letter}2:{letter}")
+    links = [row[0].strip() if row else "" for row in column]
 
-    for row in values[1:]:
-        link = row[link_col_index].strip()
-        if link:
-            links.append(link)
+    return SheetSnapshot(links=links, col_index=col_index)
 
-    return links
+
+def get_links(snapshot: SheetSnapshot) -> list[str]:
+    """Return all non-empty links from the 'link' column of the sheet."""
+    return [link for link in snapshot.links if link]
 
 
 def column_to_letter(col: int) -> str:
@@ -78,21 +105,24 @@ def column_to_letter(col: int) -> str:
     return result
 
 
-def update_sheet(sheet, items: Dict[str, Item]) -> None:
+def contiguous_runs(columns: list[int]) -> list[list[int]]:
+    """Split sorted column indices into runs of adjacent columns."""
+    runs: list[list[int]] = []
+    for col_idx in columns:
+        if runs and col_idx == runs[-1][-1] + 1:
+            runs[-1].append(col_idx)
+        else:
+            runs.append([col_idx])
+    return runs
+
+
+def update_sheet(sheet, snapshot: SheetSnapshot, items: Dict[str, Item]) -> None:
     """Batch update all parsed fields in Google Sheet."""
-    values = sheet.get_all_values()
-    if not values:
+    if not snapshot.links:
         return
 
-    headers = values[0]
+    col = snapshot.col
 
-    def col(name: str) -> int:
-        try:
-            return headers.index(name) + 1
-        except ValueError:
-            raise RuntimeError(f"Column '{name}' not found in the sheet")
-
-    col_link = col("link")
     col_price = col("price")
     col_shipping = col("shipping price")
     col_delivery = col("delivery time")
@@ -102,84 +132,172 @@ def update_sheet(sheet, items: Dict[str, Item]) -> None:
     col_brand = col("brand")
     col_model = col("model")
 
-    updates = []
-
-    for row_idx, row in enumerate(values[1:], start=2):
-        link = row[col_link - 1].strip()
+    fields = {
+        col_price: "price",
+        col_shipping: "shipping",
+        col_delivery: "delivery",
+        col_title: "title",
+        col_condition: "condition",
+        col_mpn: "mpn",
+        col_brand: "brand",
+        col_model: "model",
+    }
+    # One range per run of adjacent target columns instead of one per cell.
+    runs = contiguous_runs(sorted(fields))
+    letters = {c: column_to_letter(c) for c in fields}
+
+    def val(v):
+        return "" if v is None else v
+
+    # Ranges and row values are buffered side by side; the request payload
+    # is only assembled when it is sent.
+    ranges: list[str] = []
+    values_list: list[list] = []
+
+    for row_idx, link in enumerate(snapshot.links, start=2):
         item = items.get(link)
         if not item:
             continue
 
-        def val(v):
-            return "" if v is None else v
+        for run in runs:
+            a1 = f"{letters[run[0]]}{row_idx}:{letters[run[-1]]}{row_idx}"
+            ranges.append(a1)
+            values_list.append([val(getattr(item, fields[c])) for c in run])
 
-        def add(col_idx: int, value) -> None:
-            col_letter = column_to_letter(col_idx)
-            a1 = f"{col_letter}{row_idx}"
-            updates.append(
-                {
-                    "range": a1,
-                    "values": [[val(value)]],
-                }
-            )
+    if not ranges:
+        return
 
-        add(col_price, item.price)
-        add(col_shipping, item.shipping)
-        add(col_delivery, item.delivery)
-        add(col_title, item.title)
-        add(col_condition, item.condition)
-        add(col_mpn, item.mpn)
-        add(col_brand, item.brand)
-        add(col_model, item.model)
+    def send_chunk(start: int) -> None:
+        # Payload dicts only exist for the chunks currently being sent.
+        end = start + UPDATE_CHUNK_SIZE
+        sheet.batch_update(
+            [
+                {"range": r, "values": [v]}
+                for r, v in zip(ranges[start:end], values_list[start:end])
+            ]
+        )
+
+    # Chunks touch disjoint ranges, so they can be sent side by side.
+    with ThreadPoolExecutor(max_workers=UPDATE_WORKERS) as executor:
+        list(executor.map(send_chunk, range(0, len(ranges), UPDATE_CHUNK_SIZE)))
+
+
+def parse_html(link: str, html: str) -> Item:
+    """Extract all item fields from page HTML."""
+    parser = Parser(html)
+    return Item(
+        link=link,
+        price=parser.get_price(),
+        shipping=parser.get_shipping(),
+        delivery=parser.get_delivery_time(),
+        title=parser.get_title(),
+        condition=parser.get_param("Condition"),
+        mpn=parser.get_param("MPN"),
+        brand=parser.get_param("Brand"),
+        model=parser.get_param("Model"),
+    )
 
-    if updates:
-        sheet.batch_update(updates)
 
+def _parse_prefetched(pair: tuple[str, Optional[str]]) -> Optional[Item]:
+    """Parse HTML fetched over HTTP; None if the browser is needed."""
+    link, html = pair
+    if not html:
+        return None
+    try:
+        return parse_html(link, html)
+    except Exception as exc:
+        print(f"Parsing error for {link}: {exc}")
+        return None
 
-def parse_item(link: str) -> Item:
-    """Try to parse a single item with a few retry attempts."""
+
+def fetch_html(link: str) -> Optional[str]:
+    """Load a single page through the browser with a few retry attempts."""
     attempts = 3
-    item = Item(link=link)
 
     for attempt in range(1, attempts + 1):
         page = get_page(link, second_req=(attempt > 1))
-        if not page:
-            print(f"[{attempt}/{attempts}] Empty/blocked page for {link}")
-            continue
+        if page:
+            return page
+        print(f"[{attempt}/{attempts}] Empty/blocked page for {link}")
 
-        parser = Parser(page)
-        try:
-            item.price = parser.get_price()
-            item.shipping = parser.get_shipping()
-            item.delivery = parser.get_delivery_time()
-            item.title = parser.get_title()
-            item.condition = parser.get_param("Condition")
-            item.mpn = parser.get_param("MPN")
-            item.brand = parser.get_param("Brand")
-            item.model = parser.get_param("Model")
-            print(f"✅ Parsed: {item.title!r}")
-            return item
-        except Exception as exc:
-            print(f"[{attempt}/{attempts}] Parsing error for {link}: {exc}")
+    return None
+
+
+def parse_item(link: str) -> Item:
+    """Load a single item through the browser and parse it."""
+    page = fetch_html(link)
+    if not page:
+        print(f"⚠ Failed to load {link}")
+        return Item(link=link)
+
+    try:
+        item = parse_html(link, page)
+    except Exception as exc:
+        print(f"⚠ Parsing error for {link}: {exc}")
+        return Item(link=link)
 
-    print(f"⚠ Failed to parse {link} after {attempts} attempts")
+    print(f"✅ Parsed: {item.title!r}")
     return item
 
 
-def main() -> None:
-    sheet = get_sheet()
-    links = get_links(sheet)
-    print(f"Found {len(links)} links in the sheet")
+def scrape(links: list[str]) -> Dict[str, Item]:
+    """Fetch and parse the given links."""
+    pages = asyncio.run(fetch_all(links))
+
+    # Parsing is CPU-bound, so spread the prefetched pages across cores.
+    with ProcessPoolExecutor() as executor:
+        parsed = list(executor.map(_parse_prefetched, pages.items(), chunksize=8))
 
     items: Dict[str, Item] = {}
 
-    for idx, link in enumerate(links, start=1):
-        print(f"\n--- {idx}/{len(links)} ---")
+    for idx, (link, item) in enumerate(zip(pages, parsed), start=1):
+        print(f"\n--- {idx}/{len(pages)} ---")
         print(f"Processing: {link[:37]}")
-        item = parse_item(link)
+        if item is None:
+            # The HTTP fetch already failed or did not parse: use the browser.
+            item = parse_item(link)
+        else:
+            print(f"✅ Parsed: {item.title!r}")
         items[link] = item
 
-    update_sheet(sheet, items)
+    return items
+
+
+def parse_args() -> argparse.Namespace:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument(
+        "--force-refresh",
+        action="store_true",
+        help="ignore cached items and scrape every link again",
+    )
+    return arg_parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    sheet = get_sheet()
+    snapshot = read_snapshot(sheet)
+    links = get_links(snapshot)
+    print(f"Found {len(links)} links in the sheet")
+
+    with closing(open_cache(CACHE_PATH, CACHE_TTL)) as cache:
+        cached = {} if args.force_refresh else load_items(cache, links)
+        items: Dict[str, Item] = {
+            link: Item(**payload) for link, payload in cached.items()
+        }
+
+        stale = [link for link in dict.fromkeys(links) if link not in items]
+        print(f"{len(items)} cached, {len(stale)} to scrape")
+
+        scraped = scrape(stale)
+        # Only cache items that actually parsed; failures are retried next run.
+        save_items(
+            cache,
+            {link: asdict(item) for link, item in scraped.items() if item.title},
+        )
+        items.update(scraped)
+
+    update_sheet(sheet, snapshot, items)
     print("\n✅ Sheet update completed.")
 
 
@@ -0,0 +1,63 @@
+"""
+On-disk cache of parsed items, keyed by link, so unchanged links are not
+scraped again on every run.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import time
+from typing import Any
+
+
+# Keeps IN (...) queries under SQLite's default bound-parameter limit.
+_LOOKUP_CHUNK = 500
+
+
+def open_cache(path: str, ttl: int) -> sqlite3.Connection:
+    """
+    Open (and create if needed) the cache database.
+
+    Entries older than `ttl` seconds are dropped so the table does not grow.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS items ("
+        "link TEXT PRIMARY KEY, payload TEXT NOT NULL, ts INTEGER NOT NULL)"
+    )
+    with conn:
+        conn.execute("DELETE FROM items WHERE ts < ?", (int(time.time()) - ttl,))
+    return conn
+
+
+def load_items(conn: sqlite3.Connection, links: list[str]) -> dict[str, dict[str, Any]]:
+    """Return cached payloads for the given links."""
+    links = list(dict.fromkeys(links))
+    payloads: dict[str, dict[str, Any]] = {}
+
+    for i in range(0, len(links), _LOOKUP_CHUNK):
+        chunk = links[i : i + _LOOKUP_CHUNK]
+        placeholders = ", ".join("?" * len(chunk))
+        rows = conn.execute(
+            f"SELECT link, payload FROM items WHERE link IN ({placeholders})",
+            chunk,
+        )
+        payloads.update((link, json.loads(payload)) for link, payload in rows)
+
+    return payloads
+
+
+def save_items(conn: sqlite3.Connection, payloads: dict[str, dict[str, Any]]) -> None:
+    """Store payloads for the given links, replacing older entries."""
+    now = int(time.time())
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO items (link, payload, ts) VALUES (?, ?, ?)",
+            [(link, json.dumps(payload), now) for link, payload in payloads.items()],
+        )
@@ -1,35 +1,82 @@
 from __future__ import annotations
+from functools import lru_cache
 from typing import Optional
 import html
-from bs4 import BeautifulSoup
+import re
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+
+
+# (tag, class) -> [(node classes, node), ...] in document order
+_ClassIndex = dict[tuple[str, str], list[tuple[frozenset[str], LexborNode]]]
+
+_TITLE_RE = re.compile(r"<title[^>]*>([^<]+)</title>", re.IGNORECASE)
+
+# Every getter reads from the price block or a ux-labels-values section;
+# the page tail after the last of them is never looked at. Markers are
+# anchored to the class attribute so mentions in inline scripts and styles
+# do not push the cut point to the end of the page.
+_SECTION_MARKERS = ('class="x-price-primary', 'class="ux-labels-values')
+
+
+def _relevant_prefix(page: str) -> str:
+    """Cut the page right after the last section the getters read from."""
+    last = max(page.rfind(marker) for marker in _SECTION_MARKERS)
+    if last < 0:
+        return page
+    end = page.find("</dl>", last)
+    if end < 0:
+        return page
+    return page[: end + len("</dl>")]
+
+
+@lru_cache(maxsize=None)
+def _contains_any(*substrings: str) -> re.Pattern[str]:
+    """Compile a pattern matching text that contains any of the substrings."""
+    return re.compile("|".join(map(re.escape, substrings)))
 
 
 class Parser:
     """HTML parser for eBay product pages."""
 
+    _WEEKDAY_RE = _contains_any("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
     def __init__(self, page: str):
-        self.soup = BeautifulSoup(page, "lxml")
+        self._raw = page
+        self.tree = LexborHTMLParser(_relevant_prefix(page))
+        self._index = self._build_index()
+
+    def _build_index(self) -> _ClassIndex:
+        """Bin every classed div/dl by (tag, class) in a single tree walk."""
+        index: _ClassIndex = {}
+        for node in self.tree.css("div[class], dl[class]"):
+            classes = frozenset((node.attributes.get("class") or "").split())
+            for cls in classes:
+                index.setdefault((node.tag, cls), []).append((classes, node))
+        return index
 
     def _get_element(
         self,
         tag: str,
         class_names: list[str],
-        contains_any: Optional[list[str]] = None,
-    ):
+        contains: Optional[re.Pattern[str]] = None,
+    ) -> Optional[LexborNode]:
         """Find first element by tag and all class names, optionally filtered by text."""
-        def class_filter(classes):
-            return classes and all(c in classes for c in class_names)
-
-        elements = self.soup.find_all(tag, class_=class_filter)
+        required = frozenset(class_names)
+        # Scan the smallest (tag, class) bucket instead of the whole tree.
+        candidates = min(
+            (self._index.get((tag, c), []) for c in class_names), key=len
+        )
+        elements = [
+            node for classes, node in candidates if required.issubset(classes)
+        ]
         if not elements:
             return None
 
-        if not contains_any:
+        if contains is None:
             return elements[0]
 
         for el in elements:
-            text = el.get_text(strip=True)
-            if any(sub in text for sub in contains_any):
+            if contains.search(el.text(strip=True)):
                 return el
 
         return None
@@ -39,7 +86,7 @@ class Parser:
         if not block:
             return None
 
-        text = block.get_text(strip=True)
+        text = block.text(strip=True)
         # Typical format: "US $123.45" or "US $123.45/ea"
         text = text.replace("US $", "").replace("/ea", "").strip()
         return text or None
@@ -52,11 +99,11 @@ class Parser:
         if not block:
             return None
 
-        bold_spans = block.find_all("span", class_="ux-textspans ux-textspans--BOLD")
-        if not bold_spans:
+        bold_span = block.css_first("span.ux-textspans.ux-textspans--BOLD")
+        if not bold_span:
             return None
 
-        text = bold_spans[0].get_text(strip=True)
+        text = bold_span.text(strip=True)
 
         if "Free" in text:
             return 0
@@ -72,39 +119,44 @@ class Parser:
         block = self._get_element(
             "div",
             ["ux-labels-values__values-content"],
-            ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"],
+            self._WEEKDAY_RE,
         )
         if not block:
             return None
 
-        bold_spans = block.find_all("span", class_="ux-textspans ux-textspans--BOLD")
+        bold_spans = block.css("span.ux-textspans.ux-textspans--BOLD")
         if len(bold_spans) >= 2:
-            start = bold_spans[0].get_text(strip=True)
-            end = bold_spans[1].get_text(strip=True)
+            start = bold_spans[0].text(strip=True)
+            end = bold_spans[1].text(strip=True)
             return f"{start} to {end}"
 
         # fallback: first span text
-        span = block.find("span", class_="ux-textspans")
-        return span.get_text(strip=True) if span else None
+        span = block.css_first("span.ux-textspans")
+        return span.text(strip=True) if span else None
 
     def get_title(self) -> Optional[str]:
-        title_tag = self.soup.find("title")
-        if not title_tag:
-            return None
-        title_raw = title_tag.get_text(strip=True)
+        # <title> sits near the top of the page; a regex finds it without the tree.
+        match = _TITLE_RE.search(self._raw)
+        if match:
+            title_raw = match.group(1).strip()
+        else:
+            title_tag = self.tree.css_first("title")
+            if not title_tag:
+                return None
+            title_raw = title_tag.text(strip=True)
         return html.unescape(title_raw).replace(" | eBay", "")
 
     def get_param(self, name: str) -> Optional[str]:
         block = self._get_element(
             "dl",
             ["ux-labels-values", "ux-labels-values--inline", "col-6", "false"],
-            [name],
+            _contains_any(name),
         )
         if not block:
             return None
 
-        spans = block.find_all("span")
+        spans = block.css("span")
         if len(spans) < 2:
             return None
 
-        return spans[1].get_text(strip=True)
+        return spans[1].text(strip=True)
@@ -1,13 +1,22 @@
 """
-Simple wrapper around undetected-chromedriver to fetch eBay product pages.
+Page loaders for eBay product pages.
+
+Pages are fetched concurrently over plain HTTPS with aiohttp; the
+undetected-chromedriver browser is kept as a fallback for pages that come
+back blocked.
 """
 
 from __future__ import annotations
 
-import time
+import asyncio
 from typing import Optional
 
+import aiohttp
 import undetected_chromedriver as uc
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 
 
 _BAD_SIGNATURES = [
@@ -17,12 +26,90 @@ _BAD_SIGNATURES = [
 ]
 
 
+_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+    ),
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# A product page is ready once the price block or the eBay title shows up.
+_PAGE_READY = EC.any_of(
+    EC.presence_of_element_located((By.CSS_SELECTOR, "div.x-price-primary")),
+    EC.title_contains("| eBay"),
+)
+
+# Cap on in-flight requests; unbounded fan-out gets rate-limited by eBay.
+# Every URL is on eBay, so this is also the per-host connection limit.
+_MAX_CONCURRENCY = 8
+_HTTP_ATTEMPTS = 3
+_RETRY_STATUSES = {429, 503}
+
+
 def _is_bad_page(html: str) -> bool:
     if not html:
         return True
     return any(sig in html for sig in _BAD_SIGNATURES)
 
 
+async def fetch(
+    session: aiohttp.ClientSession,
+    url: str,
+    sem: asyncio.Semaphore,
+) -> Optional[str]:
+    """
+    Return HTML of a product page fetched over HTTP, or None if it failed.
+
+    Rate-limit responses are retried with exponential back-off.
+    """
+    async with sem:
+        for attempt in range(_HTTP_ATTEMPTS):
+            try:
+                async with session.get(url) as resp:
+                    status = resp.status
+                    # A stray invalid byte must not fail the whole gather().
+                    html = (
+                        await resp.text(errors="replace") if status == 200 else ""
+                    )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                print(f"  ❌ HTTP error for {url}: {exc}")
+                return None
+
+            if status in _RETRY_STATUSES:
+                if attempt + 1 < _HTTP_ATTEMPTS:
+                    await asyncio.sleep(2 ** attempt)
+                continue
+            if status != 200:
+                print(f"  ⚠ HTTP {status} for {url}")
+                return None
+
+            if _is_bad_page(html):
+                print(f"  ⚠ Blocked/anti-bot page over HTTP for {url}")
+                return None
+            return html
+
+    print(f"  ⚠ Still rate-limited after {_HTTP_ATTEMPTS} attempts: {url}")
+    return None
+
+
+async def fetch_all(urls: list[str]) -> dict[str, Optional[str]]:
+    """Fetch all URLs concurrently over shared keep-alive connections."""
+    urls = list(dict.fromkeys(urls))
+    sem = asyncio.Semaphore(_MAX_CONCURRENCY)
+    connector = aiohttp.TCPConnector(
+        limit_per_host=_MAX_CONCURRENCY, keepalive_timeout=30
+    )
+    timeout = aiohttp.ClientTimeout(total=30)
+
+    async with aiohttp.ClientSession(
+        connector=connector, headers=_HEADERS, timeout=timeout
+    ) as session:
+        pages = await asyncio.gather(*(fetch(session, url, sem) for url in urls))
+
+    return dict(zip(urls, pages))
+
+
 def create_driver() -> uc.Chrome:
     options = uc.ChromeOptions()
     options.add_argument("--disable-gpu")
@@ -33,7 +120,6 @@ def create_driver() -> uc.Chrome:
     driver = uc.Chrome(options=options)
     # Warm-up request — eBay homepage
     driver.get("https://www.ebay.com/")
-    time.sleep(5)
     return driver
 
 
@@ -64,7 +150,11 @@ def get_page(url: str, second_req: bool = False) -> Optional[str]:
 
     try:
         driver.get(url)
-        time.sleep(6 if second_req else 4)
+        try:
+            WebDriverWait(driver, 15 if second_req else 10).until(_PAGE_READY)
+        except TimeoutException:
+            # Whatever loaded is checked for anti-bot signatures below.
+            pass
 
         html = driver.page_source
         if _is_bad_page(html):